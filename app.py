@@ -1,35 +1,133 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
+import base64
 import io
 import json
-import base64
 import os
-import tempfile
 import sys
 
 # Add current directory to Python path for imports
 if os.path.dirname(__file__) not in sys.path:
     sys.path.append(os.path.dirname(__file__))
 
-try:
-    from PIL import Image
-except ImportError:
-    st.error("PIL/Pillow not available. Please install Pillow.")
-    st.stop()
+# Heavy modules (NumPy, Pillow and the cipher modules) are imported inside the
+# tabs and factories that use them, so the Home/About views start quickly.
 
-# Import our custom modules with error handling
-try:
-    from hill_cipher import HillCipher
-    from sdes import SDES
-    from steganography import Steganography
-    from hybrid_model import HybridCryptoModel
-except ImportError as e:
+
+def _module_import_failed(e):
+    """Report a missing custom module and stop the current run"""
     st.error(f"Failed to import custom modules: {e}")
     st.info("Make sure all Python files are in the same directory.")
     st.stop()
 
 
+# Static feature table for the Home tab
+_FEATURES_MD = """
+| Feature | Description | Status |
+|---|---|---|
+| Multi-layer Security | Three independent cryptographic layers | ✅ Implemented |
+| Key Management | Automatic key generation and storage | ✅ Implemented |
+| File Operations | Image upload/download capabilities | ✅ Implemented |
+| Visual Interface | Interactive Streamlit interface | ✅ Implemented |
+| Error Handling | Comprehensive error checking | ✅ Implemented |
+"""
+
+
+@st.cache_resource
+def get_hill():
+    """Shared HillCipher instance (built once per process, reused across reruns)"""
+    try:
+        from hill_cipher import HillCipher
+    except ImportError as e:
+        _module_import_failed(e)
+    return HillCipher()
+
+
+@st.cache_resource
+def get_sdes():
+    """Shared SDES instance"""
+    try:
+        from sdes import SDES
+    except ImportError as e:
+        _module_import_failed(e)
+    return SDES()
+
+
+@st.cache_resource
+def get_stego():
+    """Shared Steganography instance"""
+    try:
+        from steganography import Steganography
+    except ImportError as e:
+        _module_import_failed(e)
+    return Steganography()
+
+
+@st.cache_resource
+def get_hybrid():
+    """Shared HybridCryptoModel instance"""
+    try:
+        from hybrid_model import HybridCryptoModel
+    except ImportError as e:
+        _module_import_failed(e)
+    return HybridCryptoModel()
+
+
+@st.cache_data
+def _capacity(raw):
+    """Image capacity from header metadata only (no pixel decode), once per upload"""
+    from PIL import Image
+    
+    stego = get_stego()
+    img = Image.open(io.BytesIO(raw))
+    width, height = img.size
+    total_bits = width * height * len(img.getbands())
+    delimiter_bits = len(stego.string_to_binary(stego.delimiter))
+    return (total_bits - delimiter_bits) // 8, total_bits
+
+
+@st.cache_data
+def _parse_keys_json(raw):
+    """Parse an uploaded keys file once per distinct upload"""
+    import numpy as np
+    
+    keys = json.loads(raw)
+    return {
+        # Key entries are only meaningful mod 26, which also keeps them within int8
+        'hill_key': np.asarray(np.mod(keys['hill_key'], 26), dtype=np.int8),
+        'sdes_key': keys['sdes_key']
+    }
+
+
+@st.cache_data(max_entries=4)
+def _decode_pixels(raw, max_size=None):
+    """Decode an uploaded image to its RGB pixel array once per distinct upload
+    (only the last few are kept: pixel arrays can be tens of MB and the cache is process-wide)"""
+    return get_stego().load_pixels(io.BytesIO(raw), max_size)
+
+
+def _hide_to_bytes(stego, pixels, message):
+    """Hide a message in decoded cover pixels and return the encoded PNG bytes without touching the disk"""
+    stego_pixels, hidden_bits = stego.hide_message_array(pixels, message)
+    buffer = io.BytesIO()
+    stego.save_pixels(stego_pixels, buffer)
+    return buffer.getvalue(), hidden_bits
+
+
+def _is_valid_sdes_key(key):
+    """Check for exactly ten '0'/'1' characters using C-level str.count"""
+    return len(key) == 10 and key.count("0") + key.count("1") == 10
+
+
+def _validate_hill_key(hill, key_matrix):
+    """Validate a Hill key matrix, reusing the last result while the matrix is unchanged"""
+    matrix_bytes = key_matrix.tobytes()
+    cached = st.session_state.get('hill_validation_cache')
+    if cached is None or cached[0] != matrix_bytes:
+        cached = (matrix_bytes, hill.validate_key_matrix(key_matrix))
+        st.session_state.hill_validation_cache = cached
+    return cached[1]
+
+
 def main():
     st.set_page_config(
         page_title="Hybrid Cryptographic System",
@@ -112,20 +210,7 @@ def home_tab():
     # System overview
     st.subheader("📊 System Features")
     
-    features = {
-        "Feature": ["Multi-layer Security", "Key Management", "File Operations", "Visual Interface", "Error Handling"],
-        "Description": [
-            "Three independent cryptographic layers",
-            "Automatic key generation and storage",
-            "Image upload/download capabilities",
-            "Interactive Streamlit interface",
-            "Comprehensive error checking"
-        ],
-        "Status": ["✅ Implemented", "✅ Implemented", "✅ Implemented", "✅ Implemented", "✅ Implemented"]
-    }
-    
-    df = pd.DataFrame(features)
-    st.table(df)
+    st.markdown(_FEATURES_MD)
     
     # Team credits section
     st.markdown("---")
@@ -165,7 +250,9 @@ def hill_cipher_tab():
     st.header("🔑 Hill Cipher")
     st.write("Classical cryptography using matrix algebra")
     
-    hill = HillCipher()
+    import numpy as np
+    
+    hill = get_hill()
     
     # Operation selection
     operation = st.radio("Select Operation", ["Encrypt", "Decrypt"], horizontal=True)
@@ -175,41 +262,48 @@ def hill_cipher_tab():
     with col1:
         st.subheader("Input")
         
-        # Text input
-        if operation == "Encrypt":
-            text = st.text_area("Enter plaintext to encrypt:", height=100)
-        else:
-            text = st.text_area("Enter ciphertext to decrypt:", height=100)
-        
-        # Key matrix input
-        st.subheader("Key Matrix (2×2)")
+        # Key input method stays outside the form since it changes the form's fields
         key_method = st.radio("Key Input Method", ["Manual Entry", "Generate Random"], horizontal=True)
         
-        if key_method == "Manual Entry":
-            col_a, col_b = st.columns(2)
-            with col_a:
-                k11 = st.number_input("Matrix[0,0]", min_value=0, max_value=25, value=3, key="hill_k11")
-                k21 = st.number_input("Matrix[1,0]", min_value=0, max_value=25, value=5, key="hill_k21")
-            with col_b:
-                k12 = st.number_input("Matrix[0,1]", min_value=0, max_value=25, value=2, key="hill_k12")
-                k22 = st.number_input("Matrix[1,1]", min_value=0, max_value=25, value=7, key="hill_k22")
-            
-            key_matrix = np.array([[k11, k12], [k21, k22]])
-        else:
+        if key_method == "Generate Random":
             if st.button("Generate Random Key", key="hill_random"):
-                key_matrix = hill.generate_random_key()
-                st.session_state.hill_key = key_matrix
+                st.session_state.hill_key = hill.generate_random_key()
+        
+        # Batch text and key inputs so the script only reruns on submit
+        with st.form("hill_form"):
+            # Text input
+            if operation == "Encrypt":
+                text = st.text_area("Enter plaintext to encrypt:", height=100)
+            else:
+                text = st.text_area("Enter ciphertext to decrypt:", height=100)
+            
+            # Key matrix input
+            st.subheader("Key Matrix (2×2)")
             
-            if 'hill_key' in st.session_state:
-                key_matrix = st.session_state.hill_key
+            if key_method == "Manual Entry":
+                col_a, col_b = st.columns(2)
+                with col_a:
+                    k11 = st.number_input("Matrix[0,0]", min_value=0, max_value=25, value=3, key="hill_k11")
+                    k21 = st.number_input("Matrix[1,0]", min_value=0, max_value=25, value=5, key="hill_k21")
+                with col_b:
+                    k12 = st.number_input("Matrix[0,1]", min_value=0, max_value=25, value=2, key="hill_k12")
+                    k22 = st.number_input("Matrix[1,1]", min_value=0, max_value=25, value=7, key="hill_k22")
+                
+                key_matrix = np.array([[k11, k12], [k21, k22]])
             else:
-                key_matrix = np.array([[3, 2], [5, 7]])
+                if 'hill_key' in st.session_state:
+                    key_matrix = st.session_state.hill_key
+                else:
+                    key_matrix = np.array([[3, 2], [5, 7]])
+            
+            submitted = st.form_submit_button(f"{operation} Text")
         
         st.write("Key Matrix:")
         st.write(key_matrix)
         
-        # Validate key
-        if hill.validate_key_matrix(key_matrix):
+        # Validate key (once per rerun; reused by the submit handler below)
+        is_valid = _validate_hill_key(hill, key_matrix)
+        if is_valid:
             st.success("✅ Valid key matrix")
         else:
             st.error("❌ Invalid key matrix (not invertible mod 26)")
@@ -217,8 +311,8 @@ def hill_cipher_tab():
     with col2:
         st.subheader("Output")
         
-        if st.button(f"{operation} Text", key="hill_process"):
-            if text and hill.validate_key_matrix(key_matrix):
+        if submitted:
+            if text and is_valid:
                 try:
                     if operation == "Encrypt":
                         result = hill.encrypt(text, key_matrix)
@@ -235,7 +329,7 @@ def hill_cipher_tab():
             else:
                 if not text:
                     st.warning("Please enter text to process")
-                if not hill.validate_key_matrix(key_matrix):
+                if not is_valid:
                     st.error("Please use a valid key matrix")
         
         # Download result
@@ -252,7 +346,7 @@ def sdes_tab():
     st.header("🔒 SDES (Simplified Data Encryption Standard)")
     st.write("Block cipher with 10-bit key")
     
-    sdes = SDES()
+    sdes = get_sdes()
     
     # Operation selection
     operation = st.radio("Select Operation", ["Encrypt", "Decrypt"], horizontal=True, key="sdes_op")
@@ -262,48 +356,66 @@ def sdes_tab():
     with col1:
         st.subheader("Input")
         
-        # Text input
-        if operation == "Encrypt":
-            text = st.text_area("Enter plaintext to encrypt:", height=100, key="sdes_text")
-        else:
-            text = st.text_area("Enter binary ciphertext to decrypt:", height=100, key="sdes_text")
-        
-        # Key input
-        st.subheader("SDES Key (10 bits)")
+        # Key input method stays outside the form since it changes the form's fields
         key_method = st.radio("Key Input Method", ["Manual Entry", "Generate Random"], horizontal=True, key="sdes_key_method")
         
-        if key_method == "Manual Entry":
-            sdes_key = st.text_input("Enter 10-bit binary key:", value="1010000010", max_chars=10)
+        # Base64 keeps the ciphertext packed (8x smaller than one character per bit)
+        cipher_format = st.radio("Ciphertext Format", ["Binary", "Base64"], horizontal=True, key="sdes_format")
+        
+        if key_method == "Generate Random":
+            if st.button("Generate Random Key", key="sdes_random"):
+                st.session_state.sdes_key = sdes.generate_random_key()
+        
+        # Batch text and key inputs so the script only reruns on submit
+        with st.form("sdes_form"):
+            # Text input
+            if operation == "Encrypt":
+                text = st.text_area("Enter plaintext to encrypt:", height=100, key="sdes_text")
+            else:
+                text = st.text_area(f"Enter {cipher_format.lower()} ciphertext to decrypt:", height=100, key="sdes_text")
             
-            # Validate key
-            if len(sdes_key) == 10 and all(c in '01' for c in sdes_key):
-                st.success("✅ Valid SDES key")
+            # Key input
+            st.subheader("SDES Key (10 bits)")
+            
+            if key_method == "Manual Entry":
+                sdes_key = st.text_input("Enter 10-bit binary key:", value="1010000010", max_chars=10)
             else:
-                st.error("❌ Key must be exactly 10 binary digits (0s and 1s)")
-        else:
-            if st.button("Generate Random Key", key="sdes_random"):
-                sdes_key = sdes.generate_random_key()
-                st.session_state.sdes_key = sdes_key
+                if 'sdes_key' in st.session_state:
+                    sdes_key = st.session_state.sdes_key
+                else:
+                    sdes_key = "1010000010"
             
-            if 'sdes_key' in st.session_state:
-                sdes_key = st.session_state.sdes_key
+            submitted = st.form_submit_button(f"{operation} Text")
+        
+        # Validate key (once per rerun; reused by the submit handler below)
+        key_is_valid = _is_valid_sdes_key(sdes_key)
+        if key_method == "Manual Entry":
+            if key_is_valid:
+                st.success("✅ Valid SDES key")
             else:
-                sdes_key = "1010000010"
+                st.error("❌ Key must be exactly 10 binary digits (0s and 1s)")
         
         st.code(f"Key: {sdes_key}")
     
     with col2:
         st.subheader("Output")
         
-        if st.button(f"{operation} Text", key="sdes_process"):
-            if text and len(sdes_key) == 10 and all(c in '01' for c in sdes_key):
+        if submitted:
+            if text and key_is_valid:
                 try:
                     if operation == "Encrypt":
-                        result = sdes.encrypt_text(text, sdes_key)
-                        st.success("**Encrypted (Binary):**")
+                        if cipher_format == "Base64":
+                            result = base64.b64encode(sdes.encrypt_bytes(text.encode('utf-8'), sdes_key)).decode('ascii')
+                        else:
+                            result = sdes.encrypt_text(text, sdes_key)
+                        st.success(f"**Encrypted ({cipher_format}):**")
                         st.code(result)
                     else:
-                        result = sdes.decrypt_text(text, sdes_key)
+                        if cipher_format == "Base64":
+                            ciphertext = base64.b64decode(text.strip(), validate=True)
+                            result = sdes.decrypt_bytes(ciphertext, sdes_key).decode('utf-8', errors='replace')
+                        else:
+                            result = sdes.decrypt_text(text, sdes_key)
                         st.success(f"**Decrypted Text:** {result}")
                     
                     # Store result for download
@@ -331,7 +443,7 @@ def steganography_tab():
     st.header("🖼️ Image Steganography")
     st.write("Hide secret messages in images using LSB technique")
     
-    stego = Steganography()
+    stego = get_stego()
     
     # Operation selection
     operation = st.radio("Select Operation", ["Hide Message", "Extract Message"], horizontal=True, key="stego_op")
@@ -350,26 +462,23 @@ def steganography_tab():
             
             if uploaded_file is None:
                 if st.button("Create Sample Image"):
-                    sample_path = stego.create_sample_image()
-                    with open(sample_path, "rb") as f:
-                        st.download_button(
-                            "Download Sample Image",
-                            f.read(),
-                            "sample_image.png",
-                            "image/png"
-                        )
+                    # Build the sample in memory (nothing written to the working directory)
+                    sample_buffer = io.BytesIO()
+                    stego.create_sample_image(output_path=sample_buffer)
+                    st.download_button(
+                        "Download Sample Image",
+                        sample_buffer.getvalue(),
+                        "sample_image.png",
+                        "image/png"
+                    )
             else:
                 # Show uploaded image
-                image = Image.open(uploaded_file)
-                st.image(image, caption="Cover Image", use_column_width=True)
+                st.image(uploaded_file, caption="Cover Image", use_column_width=True)
                 
                 # Show capacity
                 try:
-                    # Save uploaded file temporarily
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                        image.save(tmp_file.name)
-                        max_chars, total_bits = stego.get_image_capacity(tmp_file.name)
-                        st.info(f"Image capacity: {max_chars} characters ({total_bits} bits)")
+                    max_chars, total_bits = _capacity(uploaded_file.getvalue())
+                    st.info(f"Image capacity: {max_chars} characters ({total_bits} bits)")
                 except:
                     pass
         
@@ -378,29 +487,19 @@ def steganography_tab():
             
             if st.button("Hide Message") and message and uploaded_file:
                 try:
-                    # Save uploaded image temporarily
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                        image = Image.open(uploaded_file)
-                        image.save(tmp_file.name)
-                        
-                        # Hide message
-                        output_path, hidden_bits = stego.hide_message(tmp_file.name, message)
-                        
-                        # Show result
-                        stego_image = Image.open(output_path)
-                        st.image(stego_image, caption="Steganographic Image", use_column_width=True)
-                        
-                        st.success(f"Message hidden successfully! ({hidden_bits} bits)")
-                        
-                        # Store image data in session for persistent download
-                        with open(output_path, "rb") as f:
-                            st.session_state.stego_image_data = f.read()
-                        st.session_state.stego_success = True
-                        
-                        # Clean up
-                        os.unlink(tmp_file.name)
-                        os.unlink(output_path)
-                        
+                    # Hide message in the cover pixels (decoded once per upload)
+                    cover_pixels = _decode_pixels(uploaded_file.getvalue(), stego.max_size)
+                    img_bytes, hidden_bits = _hide_to_bytes(stego, cover_pixels, message)
+                    
+                    # Show result
+                    st.image(img_bytes, caption="Steganographic Image", use_column_width=True)
+                    
+                    st.success(f"Message hidden successfully! ({hidden_bits} bits)")
+                    
+                    # Store image data in session for persistent download
+                    st.session_state.stego_image_data = img_bytes
+                    st.session_state.stego_success = True
+                    
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
     
@@ -414,39 +513,30 @@ def steganography_tab():
             uploaded_file = st.file_uploader("Choose steganographic image", type=['png', 'jpg', 'jpeg'], key="extract_img")
             
             if uploaded_file:
-                image = Image.open(uploaded_file)
-                st.image(image, caption="Steganographic Image", use_column_width=True)
+                st.image(uploaded_file, caption="Steganographic Image", use_column_width=True)
         
         with col2:
             st.subheader("Output")
             
             if st.button("Extract Message") and uploaded_file:
                 try:
-                    # Save uploaded image temporarily
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                        image = Image.open(uploaded_file)
-                        image.save(tmp_file.name)
-                        
-                        # Extract message
-                        extracted_message = stego.extract_message(tmp_file.name)
-                        
-                        if extracted_message:
-                            st.success("**Extracted Message:**")
-                            st.text_area("", value=extracted_message, height=100, key="extracted_msg")
-                            
-                            # Download button
-                            st.download_button(
-                                "Download Message",
-                                extracted_message,
-                                "extracted_message.txt",
-                                "text/plain"
-                            )
-                        else:
-                            st.warning("No hidden message found in the image")
-                        
-                        # Clean up
-                        os.unlink(tmp_file.name)
+                    # Extract message from the pixels (decoded once per upload)
+                    extracted_message = stego.extract_message_array(_decode_pixels(uploaded_file.getvalue()))
+                    
+                    if extracted_message:
+                        st.success("**Extracted Message:**")
+                        st.text_area("", value=extracted_message, height=100, key="extracted_msg")
                         
+                        # Download button
+                        st.download_button(
+                            "Download Message",
+                            extracted_message,
+                            "extracted_message.txt",
+                            "text/plain"
+                        )
+                    else:
+                        st.warning("No hidden message found in the image")
+                    
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
     
@@ -479,7 +569,9 @@ def hybrid_model_tab():
     st.header("🔐 Hybrid Cryptographic Model")
     st.write("Triple-layer security: Hill Cipher → SDES → Steganography")
     
-    hybrid = HybridCryptoModel()
+    import numpy as np
+    
+    hybrid = get_hybrid()
     
     # Operation selection
     operation = st.radio("Select Operation", ["Encrypt", "Decrypt"], horizontal=True, key="hybrid_op")
@@ -490,70 +582,71 @@ def hybrid_model_tab():
         with col1:
             st.subheader("Input")
             
-            # Text input
-            plaintext = st.text_area("Enter plaintext to encrypt:", height=100, key="hybrid_text")
-            
-            # Key management
+            # Key management (outside the form since it changes the form's fields)
             st.subheader("Key Management")
             key_option = st.radio("Key Option", ["Auto Generate", "Manual Entry"], key="hybrid_key_option")
             
-            if key_option == "Manual Entry":
-                # Hill Cipher key
-                st.write("**Hill Cipher Key (2×2 Matrix):**")
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    h11 = st.number_input("Matrix[0,0]", min_value=0, max_value=25, value=3, key="hybrid_h11")
-                    h21 = st.number_input("Matrix[1,0]", min_value=0, max_value=25, value=5, key="hybrid_h21")
-                with col_b:
-                    h12 = st.number_input("Matrix[0,1]", min_value=0, max_value=25, value=2, key="hybrid_h12")
-                    h22 = st.number_input("Matrix[1,1]", min_value=0, max_value=25, value=7, key="hybrid_h22")
-                
-                hill_key = np.array([[h11, h12], [h21, h22]])
-                
-                # SDES key
-                sdes_key = st.text_input("SDES Key (10 bits):", value="1010000010", max_chars=10, key="hybrid_sdes")
-            
             # Cover image
             st.subheader("Cover Image")
             uploaded_file = st.file_uploader("Choose cover image (optional)", type=['png', 'jpg', 'jpeg'], key="hybrid_cover")
             
             if uploaded_file:
-                image = Image.open(uploaded_file)
-                st.image(image, caption="Cover Image", width=300)
+                st.image(uploaded_file, caption="Cover Image", width=300)
+            
+            # Batch text and key inputs so the script only reruns on submit
+            with st.form("hybrid_encrypt_form"):
+                # Text input
+                plaintext = st.text_area("Enter plaintext to encrypt:", height=100, key="hybrid_text")
+                
+                if key_option == "Manual Entry":
+                    # Hill Cipher key
+                    st.write("**Hill Cipher Key (2×2 Matrix):**")
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        h11 = st.number_input("Matrix[0,0]", min_value=0, max_value=25, value=3, key="hybrid_h11")
+                        h21 = st.number_input("Matrix[1,0]", min_value=0, max_value=25, value=5, key="hybrid_h21")
+                    with col_b:
+                        h12 = st.number_input("Matrix[0,1]", min_value=0, max_value=25, value=2, key="hybrid_h12")
+                        h22 = st.number_input("Matrix[1,1]", min_value=0, max_value=25, value=7, key="hybrid_h22")
+                    
+                    hill_key = np.array([[h11, h12], [h21, h22]])
+                    
+                    # SDES key
+                    sdes_key = st.text_input("SDES Key (10 bits):", value="1010000010", max_chars=10, key="hybrid_sdes")
+                
+                submitted = st.form_submit_button("🔐 Hybrid Encrypt")
         
         with col2:
             st.subheader("Output")
             
-            if st.button("🔐 Hybrid Encrypt", key="hybrid_encrypt_btn"):
+            if submitted:
                 if plaintext:
                     try:
                         # Prepare parameters
                         hill_key_param = None if key_option == "Auto Generate" else hill_key
                         sdes_key_param = None if key_option == "Auto Generate" else sdes_key
-                        image_path = None
-                        
-                        # Handle cover image
-                        if uploaded_file:
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                                image = Image.open(uploaded_file)
-                                image.save(tmp_file.name)
-                                image_path = tmp_file.name
+                        # Handle cover image (read in memory, no temp file)
+                        image_path = uploaded_file if uploaded_file else None
                         
-                        # Encrypt
+                        # Encrypt straight into an in-memory PNG
+                        output_buffer = io.BytesIO()
                         with st.spinner("Encrypting..."):
                             result = hybrid.hybrid_encrypt(
                                 plaintext, 
                                 hill_key_param, 
                                 sdes_key_param, 
-                                image_path
+                                image_path,
+                                output_buffer
                             )
                         
                         if result['success']:
                             st.success("✅ Hybrid encryption completed!")
                             
+                            # The same bytes are displayed and kept for download
+                            image_data = output_buffer.getvalue()
+                            
                             # Show encrypted image
-                            stego_image = Image.open(result['encrypted_image_path'])
-                            st.image(stego_image, caption="Encrypted Image", width=300)
+                            st.image(image_data, caption="Encrypted Image", width=300)
                             
                             # Show keys used
                             st.subheader("🔑 Keys Used")
@@ -563,8 +656,7 @@ def hybrid_model_tab():
                             st.session_state.hybrid_result = result
                             
                             # Store image data and keys in session for download
-                            with open(result['encrypted_image_path'], "rb") as f:
-                                st.session_state.encrypted_image_data = f.read()
+                            st.session_state.encrypted_image_data = image_data
                             st.session_state.keys_json = json.dumps(result['keys'], indent=2)
                             
                         else:
@@ -585,8 +677,7 @@ def hybrid_model_tab():
             encrypted_file = st.file_uploader("Choose encrypted image", type=['png', 'jpg', 'jpeg'], key="hybrid_encrypted")
             
             if encrypted_file:
-                image = Image.open(encrypted_file)
-                st.image(image, caption="Encrypted Image", width=300)
+                st.image(encrypted_file, caption="Encrypted Image", width=300)
             
             # Keys input
             st.subheader("Decryption Keys")
@@ -597,64 +688,61 @@ def hybrid_model_tab():
                 keys_file = st.file_uploader("Upload keys file", type=['json'])
                 
                 if keys_file:
-                    keys_data = json.load(keys_file)
-                    st.json(keys_data)
-                    hill_key = np.array(keys_data['hill_key'])
+                    keys_data = _parse_keys_json(keys_file.getvalue())
+                    hill_key = keys_data['hill_key']
                     sdes_key = keys_data['sdes_key']
+                    st.json({'hill_key': hill_key.tolist(), 'sdes_key': sdes_key})
                 else:
                     hill_key = None
                     sdes_key = None
-            else:
-                # Manual key entry
-                st.write("**Hill Cipher Key:**")
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    d11 = st.number_input("Matrix[0,0]", min_value=0, max_value=25, value=3, key="decrypt_h11")
-                    d21 = st.number_input("Matrix[1,0]", min_value=0, max_value=25, value=5, key="decrypt_h21")
-                with col_b:
-                    d12 = st.number_input("Matrix[0,1]", min_value=0, max_value=25, value=2, key="decrypt_h12")
-                    d22 = st.number_input("Matrix[1,1]", min_value=0, max_value=25, value=7, key="decrypt_h22")
                 
-                hill_key = np.array([[d11, d12], [d21, d22]])
-                sdes_key = st.text_input("SDES Key:", value="1010000010", key="decrypt_sdes")
+                submitted = st.button("🔓 Hybrid Decrypt", key="hybrid_decrypt_btn")
+            else:
+                # Manual key entry, batched so the script only reruns on submit
+                with st.form("hybrid_decrypt_form"):
+                    st.write("**Hill Cipher Key:**")
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        d11 = st.number_input("Matrix[0,0]", min_value=0, max_value=25, value=3, key="decrypt_h11")
+                        d21 = st.number_input("Matrix[1,0]", min_value=0, max_value=25, value=5, key="decrypt_h21")
+                    with col_b:
+                        d12 = st.number_input("Matrix[0,1]", min_value=0, max_value=25, value=2, key="decrypt_h12")
+                        d22 = st.number_input("Matrix[1,1]", min_value=0, max_value=25, value=7, key="decrypt_h22")
+                    
+                    hill_key = np.array([[d11, d12], [d21, d22]], dtype=np.int8)
+                    sdes_key = st.text_input("SDES Key:", value="1010000010", key="decrypt_sdes")
+                    
+                    submitted = st.form_submit_button("🔓 Hybrid Decrypt")
         
         with col2:
             st.subheader("Output")
             
-            if st.button("🔓 Hybrid Decrypt", key="hybrid_decrypt_btn"):
+            if submitted:
                 if encrypted_file and hill_key is not None and sdes_key:
                     try:
-                        # Save encrypted image temporarily
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                            image = Image.open(encrypted_file)
-                            image.save(tmp_file.name)
-                            
-                            # Decrypt
-                            with st.spinner("Decrypting..."):
-                                result = hybrid.hybrid_decrypt(tmp_file.name, hill_key, sdes_key)
+                        # Decrypt straight from the in-memory upload
+                        with st.spinner("Decrypting..."):
+                            result = hybrid.hybrid_decrypt(encrypted_file, hill_key, sdes_key)
+                        
+                        if result['success']:
+                            st.success("✅ Hybrid decryption completed!")
                             
-                            if result['success']:
-                                st.success("✅ Hybrid decryption completed!")
-                                
-                                # Show decrypted text
-                                decrypted_text = result['decrypted_text']
-                                st.subheader("📝 Decrypted Text")
-                                st.text_area("", value=decrypted_text, height=100, key="decrypted_output")
-                                
-                                # Download button
-                                st.download_button(
-                                    "Download Decrypted Text",
-                                    decrypted_text,
-                                    "decrypted_text.txt",
-                                    "text/plain"
-                                )
-                                
-                            else:
-                                st.error(f"❌ Decryption failed: {result['error']}")
+                            # Show decrypted text
+                            decrypted_text = result['decrypted_text']
+                            st.subheader("📝 Decrypted Text")
+                            st.text_area("", value=decrypted_text, height=100, key="decrypted_output")
                             
-                            # Clean up
-                            os.unlink(tmp_file.name)
+                            # Download button
+                            st.download_button(
+                                "Download Decrypted Text",
+                                decrypted_text,
+                                "decrypted_text.txt",
+                                "text/plain"
+                            )
                             
+                        else:
+                            st.error(f"❌ Decryption failed: {result['error']}")
+                        
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
                 else:
@@ -1,11 +1,7 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
 import io
 import json
-import base64
 import os
-import tempfile
 import sys
 
 # Configure Streamlit page
@@ -20,19 +16,12 @@ st.set_page_config(
 if os.path.dirname(__file__) not in sys.path:
     sys.path.append(os.path.dirname(__file__))
 
-try:
-    from PIL import Image
-except ImportError:
-    st.error("PIL/Pillow not available. Please check requirements.txt")
-    st.stop()
+# The cipher modules (and Pillow, through steganography) are imported on first
+# use (see the factories below), so the Home view starts without loading them.
+
 
-# Import our custom modules with error handling
-try:
-    from hill_cipher import HillCipher
-    from sdes import SDES
-    from steganography import Steganography
-    from hybrid_model import HybridCryptoModel
-except ImportError as e:
+def _module_import_failed(e):
+    """Report a module that failed to import and stop the current run"""
     st.error(f"Failed to import modules: {e}")
     st.info("Ensure all Python files are deployed together.")
     
@@ -45,6 +34,56 @@ except ImportError as e:
         st.write("Cannot list directory contents")
     st.stop()
 
+
+@st.cache_resource
+def get_hill():
+    """Shared HillCipher instance (built once per process, reused across reruns)"""
+    try:
+        from hill_cipher import HillCipher
+    except ImportError as e:
+        _module_import_failed(e)
+    return HillCipher()
+
+
+@st.cache_resource
+def get_sdes():
+    """Shared SDES instance"""
+    try:
+        from sdes import SDES
+    except ImportError as e:
+        _module_import_failed(e)
+    return SDES()
+
+
+@st.cache_resource
+def get_stego():
+    """Shared Steganography instance"""
+    try:
+        from steganography import Steganography
+    except ImportError as e:
+        _module_import_failed(e)
+    return Steganography()
+
+
+@st.cache_resource
+def get_hybrid():
+    """Shared HybridCryptoModel instance"""
+    try:
+        from hybrid_model import HybridCryptoModel
+    except ImportError as e:
+        _module_import_failed(e)
+    return HybridCryptoModel()
+
+# Static feature table for the Home tab
+_FEATURES_MD = """
+| Feature | Description | Status |
+|---|---|---|
+| Multi-layer Security | Three independent cryptographic layers | ✅ Implemented |
+| Key Management | Automatic key generation and storage | ✅ Implemented |
+| File Operations | Image upload/download capabilities | ✅ Implemented |
+| Visual Interface | Interactive Streamlit interface | ✅ Implemented |
+"""
+
 def main():
     # Title and description
     st.title("🔐 Hybrid Cryptographic System")
@@ -117,26 +156,16 @@ def home_tab():
     # System overview
     st.subheader("📊 System Features")
     
-    features = {
-        "Feature": ["Multi-layer Security", "Key Management", "File Operations", "Visual Interface"],
-        "Description": [
-            "Three independent cryptographic layers",
-            "Automatic key generation and storage",
-            "Image upload/download capabilities",
-            "Interactive Streamlit interface"
-        ],
-        "Status": ["✅ Implemented", "✅ Implemented", "✅ Implemented", "✅ Implemented"]
-    }
-    
-    df = pd.DataFrame(features)
-    st.table(df)
+    st.markdown(_FEATURES_MD)
 
 def hill_cipher_tab():
     st.header("🔑 Hill Cipher")
     st.write("Classical cryptography using matrix algebra")
     
+    import numpy as np
+    
     try:
-        hill = HillCipher()
+        hill = get_hill()
         
         # Operation selection
         operation = st.radio("Select Operation", ["Encrypt", "Decrypt"], horizontal=True)
@@ -179,8 +208,9 @@ def hill_cipher_tab():
             st.write("Key Matrix:")
             st.write(key_matrix)
             
-            # Validate key
-            if hill.validate_key_matrix(key_matrix):
+            # Validate key (once per rerun; also gates the process button)
+            is_valid = hill.validate_key_matrix(key_matrix)
+            if is_valid:
                 st.success("✅ Valid key matrix")
             else:
                 st.error("❌ Invalid key matrix (not invertible mod 26)")
@@ -188,8 +218,9 @@ def hill_cipher_tab():
         with col2:
             st.subheader("Output")
             
-            if st.button(f"{operation} Text", key="hill_process"):
-                if text and hill.validate_key_matrix(key_matrix):
+            # Disabled while the key is invalid, so a bad click doesn't cost a rerun
+            if st.button(f"{operation} Text", key="hill_process", disabled=not is_valid):
+                if text:
                     try:
                         if operation == "Encrypt":
                             result = hill.encrypt(text, key_matrix)
@@ -204,10 +235,7 @@ def hill_cipher_tab():
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
                 else:
-                    if not text:
-                        st.warning("Please enter text to process")
-                    if not hill.validate_key_matrix(key_matrix):
-                        st.error("Please use a valid key matrix")
+                    st.warning("Please enter text to process")
             
             # Download result
             if 'hill_result' in st.session_state:
@@ -226,7 +254,7 @@ def sdes_tab():
     st.write("Block cipher with 10-bit key")
     
     try:
-        sdes = SDES()
+        sdes = get_sdes()
         
         # Operation selection
         operation = st.radio("Select Operation", ["Encrypt", "Decrypt"], horizontal=True, key="sdes_op")
@@ -248,12 +276,6 @@ def sdes_tab():
             
             if key_method == "Manual Entry":
                 sdes_key = st.text_input("Enter 10-bit binary key:", value="1010000010", max_chars=10)
-                
-                # Validate key
-                if len(sdes_key) == 10 and all(c in '01' for c in sdes_key):
-                    st.success("✅ Valid SDES key")
-                else:
-                    st.error("❌ Key must be exactly 10 binary digits (0s and 1s)")
             else:
                 if st.button("Generate Random Key", key="sdes_random"):
                     sdes_key = sdes.generate_random_key()
@@ -264,13 +286,22 @@ def sdes_tab():
                 else:
                     sdes_key = "1010000010"
             
+            # Validate key (once per rerun; also gates the process button)
+            key_is_valid = len(sdes_key) == 10 and sdes_key.count('0') + sdes_key.count('1') == 10
+            if key_method == "Manual Entry":
+                if key_is_valid:
+                    st.success("✅ Valid SDES key")
+                else:
+                    st.error("❌ Key must be exactly 10 binary digits (0s and 1s)")
+            
             st.code(f"Key: {sdes_key}")
         
         with col2:
             st.subheader("Output")
             
-            if st.button(f"{operation} Text", key="sdes_process"):
-                if text and len(sdes_key) == 10 and all(c in '01' for c in sdes_key):
+            # Disabled while the key is invalid, so a bad click doesn't cost a rerun
+            if st.button(f"{operation} Text", key="sdes_process", disabled=not key_is_valid):
+                if text:
                     try:
                         if operation == "Encrypt":
                             result = sdes.encrypt_text(text, sdes_key)
@@ -286,10 +317,7 @@ def sdes_tab():
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
                 else:
-                    if not text:
-                        st.warning("Please enter text to process")
-                    else:
-                        st.error("Please enter a valid 10-bit binary key")
+                    st.warning("Please enter text to process")
             
             # Download result
             if 'sdes_result' in st.session_state:
@@ -308,7 +336,7 @@ def steganography_tab():
     st.write("Hide secret messages in images using LSB technique")
     
     try:
-        stego = Steganography()
+        stego = get_stego()
         
         # Operation selection
         operation = st.radio("Select Operation", ["Hide Message", "Extract Message"], horizontal=True, key="stego_op")
@@ -328,28 +356,25 @@ def steganography_tab():
                 if uploaded_file is None:
                     if st.button("Create Sample Image"):
                         try:
-                            sample_path = stego.create_sample_image(width=400, height=300)
-                            with open(sample_path, "rb") as f:
-                                st.download_button(
-                                    "Download Sample Image",
-                                    f.read(),
-                                    "sample_image.png",
-                                    "image/png"
-                                )
+                            sample_buffer = io.BytesIO()
+                            stego.create_sample_image(width=400, height=300, output_path=sample_buffer)
+                            st.download_button(
+                                "Download Sample Image",
+                                sample_buffer.getvalue(),
+                                "sample_image.png",
+                                "image/png"
+                            )
                         except Exception as e:
                             st.error(f"Could not create sample image: {e}")
                 else:
-                    # Show uploaded image
-                    image = Image.open(uploaded_file)
-                    st.image(image, caption="Cover Image", use_column_width=True)
+                    # Show uploaded image (bytes are served as-is, no re-encode)
+                    st.image(uploaded_file.getvalue(), caption="Cover Image", use_column_width=True)
                     
                     # Show capacity
                     try:
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                            image.save(tmp_file.name)
-                            max_chars, total_bits = stego.get_image_capacity(tmp_file.name)
-                            st.info(f"Image capacity: {max_chars} characters ({total_bits} bits)")
-                            os.unlink(tmp_file.name)
+                        # Read straight from the in-memory upload
+                        max_chars, total_bits = stego.get_image_capacity(uploaded_file)
+                        st.info(f"Image capacity: {max_chars} characters ({total_bits} bits)")
                     except Exception as e:
                         st.warning(f"Could not calculate capacity: {e}")
             
@@ -358,29 +383,22 @@ def steganography_tab():
                 
                 if st.button("Hide Message") and message and uploaded_file:
                     try:
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_input:
-                            image = Image.open(uploaded_file)
-                            image.save(tmp_input.name)
-                            
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_output:
-                                # Hide message
-                                output_path, hidden_bits = stego.hide_message(tmp_input.name, message, tmp_output.name)
-                                
-                                # Show result
-                                stego_image = Image.open(output_path)
-                                st.image(stego_image, caption="Steganographic Image", use_column_width=True)
-                                
-                                st.success(f"Message hidden successfully! ({hidden_bits} bits)")
-                                
-                                # Store result in session state for persistent download
-                                with open(output_path, "rb") as f:
-                                    st.session_state.stego_image_data = f.read()
-                                st.session_state.stego_message = message
-                            
-                            # Clean up
-                            os.unlink(tmp_input.name)
-                            os.unlink(tmp_output.name)
-                            
+                        # Hide message, reading the upload and writing the PNG in memory
+                        output_buffer = io.BytesIO()
+                        _, hidden_bits = stego.hide_message(uploaded_file, message, output_buffer)
+                        
+                        # The same bytes are shown and kept for download
+                        stego_image_data = output_buffer.getvalue()
+                        
+                        # Show result
+                        st.image(stego_image_data, caption="Steganographic Image", use_column_width=True)
+                        
+                        st.success(f"Message hidden successfully! ({hidden_bits} bits)")
+                        
+                        # Store result in session state for persistent download
+                        st.session_state.stego_image_data = stego_image_data
+                        st.session_state.stego_message = message
+                        
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
         
@@ -394,32 +412,24 @@ def steganography_tab():
                 uploaded_file = st.file_uploader("Choose steganographic image", type=['png', 'jpg', 'jpeg'], key="extract_img")
                 
                 if uploaded_file:
-                    image = Image.open(uploaded_file)
-                    st.image(image, caption="Steganographic Image", use_column_width=True)
+                    st.image(uploaded_file.getvalue(), caption="Steganographic Image", use_column_width=True)
             
             with col2:
                 st.subheader("Output")
                 
                 if st.button("Extract Message") and uploaded_file:
                     try:
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                            image = Image.open(uploaded_file)
-                            image.save(tmp_file.name)
-                            
-                            # Extract message
-                            extracted_message = stego.extract_message(tmp_file.name)
-                            
-                            if extracted_message:
-                                st.success("**Extracted Message:**")
-                                st.text_area("", value=extracted_message, height=100, key="extracted_msg")
-                                
-                                # Store extracted message in session state
-                                st.session_state.extracted_message = extracted_message
-                            else:
-                                st.warning("No hidden message found in the image")
+                        # Extract message straight from the in-memory upload
+                        extracted_message = stego.extract_message(uploaded_file)
+                        
+                        if extracted_message:
+                            st.success("**Extracted Message:**")
+                            st.text_area("", value=extracted_message, height=100, key="extracted_msg")
                             
-                            # Clean up
-                            os.unlink(tmp_file.name)
+                            # Store extracted message in session state
+                            st.session_state.extracted_message = extracted_message
+                        else:
+                            st.warning("No hidden message found in the image")
                             
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
@@ -453,8 +463,10 @@ def hybrid_model_tab():
     st.header("🔐 Hybrid Cryptographic Model")
     st.write("Triple-layer security: Hill Cipher → SDES → Steganography")
     
+    import numpy as np
+    
     try:
-        hybrid = HybridCryptoModel()
+        hybrid = get_hybrid()
         
         # Operation selection
         operation = st.radio("Select Operation", ["Encrypt", "Decrypt"], horizontal=True, key="hybrid_op")
@@ -493,8 +505,7 @@ def hybrid_model_tab():
                 uploaded_file = st.file_uploader("Choose cover image", type=['png', 'jpg', 'jpeg'], key="hybrid_cover")
                 
                 if uploaded_file:
-                    image = Image.open(uploaded_file)
-                    st.image(image, caption="Cover Image", width=300)
+                    st.image(uploaded_file.getvalue(), caption="Cover Image", width=300)
             
             with col2:
                 st.subheader("Output")
@@ -505,30 +516,29 @@ def hybrid_model_tab():
                             # Prepare parameters
                             hill_key_param = None if key_option == "Auto Generate" else hill_key
                             sdes_key_param = None if key_option == "Auto Generate" else sdes_key
-                            image_path = None
                             
-                            # Handle cover image
-                            if uploaded_file:
-                                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp_file:
-                                    image = Image.open(uploaded_file)
-                                    image.save(tmp_file.name)
-                                    image_path = tmp_file.name
+                            # Handle cover image (read in memory, no temp file)
+                            image_path = uploaded_file if uploaded_file else None
                             
-                            # Encrypt
+                            # Encrypt straight into an in-memory PNG
+                            output_buffer = io.BytesIO()
                             with st.spinner("Encrypting..."):
                                 result = hybrid.hybrid_encrypt(
                                     plaintext, 
                                     hill_key_param, 
                                     sdes_key_param, 
-                                    image_path
+                                    image_path,
+                                    output_buffer
                                 )
                             
                             if result['success']:
                                 st.success("✅ Hybrid encryption completed!")
                                 
+                                # The same bytes are shown and kept for download
+                                encrypted_image_data = output_buffer.getvalue()
+                                
                                 # Show encrypted image
-                                stego_image = Image.open(result['encrypted_image_path'])
-                                st.image(stego_image, caption="Encrypted Image", width=300)
+                                st.image(encrypted_image_data, caption="Encrypted Image", width=300)
                                 
                                 # Show keys used
                                 st.subheader("🔑 Keys Used")
@@ -538,8 +548,7 @@ def hybrid_model_tab():
                                 st.session_state.hybrid_result = result
                                 
                                 # Store image data and keys in session for persistent download
-                                with open(result['encrypted_image_path'], "rb") as f:
-                                    st.session_state.encrypted_image_data = f.read()
+                                st.session_state.encrypted_image_data = encrypted_image_data
                                 st.session_state.keys_json = json.dumps(result['keys'], indent=2)
                                 
                             else:
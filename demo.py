@@ -11,12 +11,17 @@ import os
 from hill_cipher import HillCipher
 from sdes import SDES
 
+# Shared by all demos, so the SDES table built for a key in demo_sdes is
+# reused by demo_hybrid_crypto instead of being rebuilt
+_HILL = HillCipher()
+_SDES = SDES()
+
 def demo_hill_cipher():
     """Demonstrate Hill Cipher"""
     print("🔑 HILL CIPHER DEMO")
     print("-" * 40)
     
-    hill = HillCipher()
+    hill = _HILL
     
     # Test data
     plaintext = "HELLO WORLD"
@@ -45,7 +50,7 @@ def demo_sdes():
     print("\n🔒 SDES DEMO")
     print("-" * 40)
     
-    sdes = SDES()
+    sdes = _SDES
     
     # Test data
     plaintext = "Hello World!"
@@ -74,8 +79,8 @@ def demo_hybrid_crypto():
     print("-" * 40)
     
     # Initialize
-    hill = HillCipher()
-    sdes = SDES()
+    hill = _HILL
+    sdes = _SDES
     
     # Test data
     plaintext = "SECRET MESSAGE"
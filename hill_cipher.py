@@ -1,13 +1,27 @@
 import numpy as np
+import secrets
 import string
 from math import gcd
 
+# Byte tables for prepare_text: fold a-z to A-Z and drop every other byte
+_UPPERCASE = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+_NON_LETTERS = bytes(b for b in range(256) if not chr(b).isascii() or not chr(b).isalpha())
+
+# Determinants (mod 26) that make a key matrix invertible
+_COPRIME_26 = np.array([gcd(value, 26) == 1 for value in range(26)])
 
 class HillCipher:
     def __init__(self):
         self.alphabet = string.ascii_uppercase
         self.alphabet_size = 26
         
+        # Digraph lookup tables, built once per key (or inverse key) matrix
+        self._digraph_tables = {}
+        
+        # Already validated key matrices and their inverses, keyed by matrix bytes
+        self._valid_keys = set()
+        self._inverse_cache = {}
+        
     def char_to_num(self, char):
         """Convert character to number (A=0, B=1, ..., Z=25)"""
         return ord(char.upper()) - ord('A')
@@ -18,15 +32,23 @@ class HillCipher:
     
     def prepare_text(self, text):
         """Prepare text by removing non-alphabetic characters and converting to uppercase"""
-        cleaned = ''.join([char.upper() for char in text if char.isalpha()])
+        return self._prepare_bytes(text).decode('ascii')
+    
+    def _prepare_bytes(self, text):
+        """prepare_text as ASCII bytes, so encrypt/decrypt never round-trip through str"""
+        # One C-level pass; only A-Z exist in the 26-letter alphabet, so other letters are dropped
+        cleaned = text.encode('ascii', 'ignore').translate(_UPPERCASE, _NON_LETTERS)
         # Pad with 'X' if length is odd (for 2x2 matrix)
         if len(cleaned) % 2 == 1:
-            cleaned += 'X'
+            cleaned += b'X'
         return cleaned
     
     def matrix_mod_inverse(self, matrix, mod):
         """Calculate modular inverse of a 2x2 matrix"""
-        det = int(np.round(np.linalg.det(matrix))) % mod
+        # Plain Python ints: exact (no float determinant) and free of small-dtype overflow;
+        # integral float keys are accepted, as they were with the float determinant
+        (a, b), (c, d) = np.asarray(matrix, dtype=np.int64).tolist()
+        det = (a * d - b * c) % mod
         
         # Check if determinant and modulus are coprime
         if gcd(det, mod) != 1:
@@ -35,117 +57,126 @@ class HillCipher:
         # Find modular inverse of determinant
         det_inv = self.mod_inverse(det, mod)
         
-        # Calculate adjugate matrix
-        adj_matrix = np.array([[matrix[1, 1], -matrix[0, 1]], 
-                              [-matrix[1, 0], matrix[0, 0]]])
-        
-        # Calculate inverse matrix
-        inv_matrix = (det_inv * adj_matrix) % mod
-        return inv_matrix.astype(int)
+        # Inverse = det^-1 * adjugate (mod m)
+        return np.array([[(det_inv * d) % mod, (-det_inv * b) % mod],
+                         [(-det_inv * c) % mod, (det_inv * a) % mod]])
     
     def mod_inverse(self, a, m):
         """Calculate modular inverse using extended Euclidean algorithm"""
         if gcd(a, m) != 1:
             raise ValueError(f"Modular inverse of {a} mod {m} does not exist")
         
-        # Extended Euclidean Algorithm
-        def extended_gcd(a, b):
-            if a == 0:
-                return b, 0, 1
-            gcd_val, x1, y1 = extended_gcd(b % a, a)
-            x = y1 - (b // a) * x1
-            y = x1
-            return gcd_val, x, y
+        # Extended Euclidean Algorithm (iterative; only the coefficient of a is needed)
+        old_r, r = a % m, m
+        old_s, s = 1, 0
+        while r:
+            q = old_r // r
+            old_r, r = r, old_r - q * r
+            old_s, s = s, old_s - q * s
+        return old_s % m
+    
+    def digraph_table(self, matrix):
+        """676x2 uint8 table of output letters for every block (row 26*p0 + p1) under this matrix"""
+        entries = tuple(np.asarray(matrix).ravel().tolist())
+        table = self._digraph_tables.get(entries)
+        if table is None:
+            # Only 26*26 blocks exist, so encrypt all of them once: (K * P) for every block is P @ K.T
+            blocks = np.stack(np.divmod(np.arange(self.alphabet_size ** 2), self.alphabet_size), axis=1)
+            key = np.array(entries, dtype=np.int64).reshape(2, 2)
+            table = ((blocks @ key.T) % self.alphabet_size + ord('A')).astype(np.uint8)
+            
+            # Keep memory bounded when many different keys are tried
+            if len(self._digraph_tables) >= 64:
+                self._digraph_tables.clear()
+            self._digraph_tables[entries] = table
+        return table
+    
+    def _transform_blocks(self, cleaned, matrix):
+        """Map every 2-character block of prepared bytes through the matrix's digraph table"""
+        # Prepared text is pure A-Z, one byte per character
+        nums = np.frombuffer(cleaned, dtype=np.uint8) - ord('A')
+        
+        # Row index of each block in the table (at most 675, so uint16 is enough
+        # and moves a quarter of the bytes an int64 index would)
+        blocks = nums.reshape(-1, 2).astype(np.uint16)
+        index = blocks[:, 0] * self.alphabet_size + blocks[:, 1]
         
-        _, x, _ = extended_gcd(a % m, m)
-        return (x % m + m) % m
+        return self.digraph_table(matrix)[index].tobytes()
     
     def validate_key_matrix(self, key_matrix):
         """Validate that the key matrix is invertible mod 26"""
         try:
-            det = int(np.round(np.linalg.det(key_matrix))) % self.alphabet_size
-            if gcd(det, self.alphabet_size) != 1:
-                return False
-            return True
+            # Exact 2x2 cofactor expansion in Python ints (no LAPACK call, no float rounding)
+            (a, b), (c, d) = np.asarray(key_matrix).tolist()
+            det = int(a * d - b * c) % self.alphabet_size
+            return gcd(det, self.alphabet_size) == 1
         except:
             return False
     
+    def _checked_key(self, key_matrix):
+        """Validate a key matrix once per instance and return its cache key"""
+        cache_key = (key_matrix.dtype.str, key_matrix.shape, key_matrix.tobytes())
+        if cache_key not in self._valid_keys:
+            if not self.validate_key_matrix(key_matrix):
+                raise ValueError("Key matrix is not valid (determinant not coprime with 26)")
+            if len(self._valid_keys) >= 64:
+                self._valid_keys.clear()
+            self._valid_keys.add(cache_key)
+        return cache_key
+    
     def encrypt(self, plaintext, key_matrix):
         """Encrypt plaintext using Hill cipher"""
+        return self.encrypt_bytes(plaintext, key_matrix).decode('ascii')
+    
+    def encrypt_bytes(self, plaintext, key_matrix):
+        """Encrypt plaintext and return the ciphertext as ASCII bytes (for byte-oriented next stages)"""
         if not isinstance(key_matrix, np.ndarray):
             key_matrix = np.array(key_matrix)
         
-        if not self.validate_key_matrix(key_matrix):
-            raise ValueError("Key matrix is not valid (determinant not coprime with 26)")
-        
-        cleaned_text = self.prepare_text(plaintext)
-        if len(cleaned_text) == 0:
-            return ""
-        
-        ciphertext = ""
+        # Keys reused across calls (e.g. by the hybrid model) are only validated once
+        self._checked_key(key_matrix)
         
-        # Process text in blocks of 2
-        for i in range(0, len(cleaned_text), 2):
-            block = cleaned_text[i:i+2]
-            if len(block) == 1:
-                block += 'X'  # Padding
-            
-            # Convert to numbers
-            vector = np.array([[self.char_to_num(block[0])], 
-                              [self.char_to_num(block[1])]])
-            
-            # Encrypt: C = (K * P) mod 26
-            encrypted_vector = np.dot(key_matrix, vector) % self.alphabet_size
-            
-            # Convert back to characters
-            ciphertext += self.num_to_char(encrypted_vector[0, 0])
-            ciphertext += self.num_to_char(encrypted_vector[1, 0])
+        cleaned = self._prepare_bytes(plaintext)
+        if len(cleaned) == 0:
+            return b""
         
-        return ciphertext
+        # Encrypt all blocks at once: C = (K * P) mod 26
+        return self._transform_blocks(cleaned, key_matrix)
     
     def decrypt(self, ciphertext, key_matrix):
         """Decrypt ciphertext using Hill cipher"""
         if not isinstance(key_matrix, np.ndarray):
             key_matrix = np.array(key_matrix)
         
-        if not self.validate_key_matrix(key_matrix):
-            raise ValueError("Key matrix is not valid (determinant not coprime with 26)")
-        
-        # Calculate inverse key matrix
-        inv_key_matrix = self.matrix_mod_inverse(key_matrix, self.alphabet_size)
-        
-        cleaned_text = self.prepare_text(ciphertext)
-        if len(cleaned_text) == 0:
+        # Validate and invert each key only once
+        cache_key = self._checked_key(key_matrix)
+        inv_key_matrix = self._inverse_cache.get(cache_key)
+        if inv_key_matrix is None:
+            # Calculate inverse key matrix
+            inv_key_matrix = self.matrix_mod_inverse(key_matrix, self.alphabet_size)
+            if len(self._inverse_cache) >= 64:
+                self._inverse_cache.clear()
+            self._inverse_cache[cache_key] = inv_key_matrix
+        
+        cleaned = self._prepare_bytes(ciphertext)
+        if len(cleaned) == 0:
             return ""
         
-        plaintext = ""
-        
-        # Process text in blocks of 2
-        for i in range(0, len(cleaned_text), 2):
-            block = cleaned_text[i:i+2]
-            if len(block) == 1:
-                block += 'X'  # Padding
-            
-            # Convert to numbers
-            vector = np.array([[self.char_to_num(block[0])], 
-                              [self.char_to_num(block[1])]])
-            
-            # Decrypt: P = (K^-1 * C) mod 26
-            decrypted_vector = np.dot(inv_key_matrix, vector) % self.alphabet_size
-            
-            # Convert back to characters
-            plaintext += self.num_to_char(decrypted_vector[0, 0])
-            plaintext += self.num_to_char(decrypted_vector[1, 0])
-        
-        return plaintext
+        # Decrypt all blocks at once: P = (K^-1 * C) mod 26
+        return self._transform_blocks(cleaned, inv_key_matrix).decode('ascii')
     
     def generate_random_key(self):
         """Generate a random valid 2x2 key matrix"""
+        # Key material: seed from the OS CSPRNG, not NumPy's global Mersenne Twister
+        rng = np.random.default_rng(secrets.randbits(128))
         while True:
-            # Generate random 2x2 matrix
-            matrix = np.random.randint(0, self.alphabet_size, size=(2, 2))
-            if self.validate_key_matrix(matrix):
-                return matrix
+            # Draw a batch of random 2x2 matrices and check all determinants at once
+            # (about 12/26 of candidates are valid, so one batch almost always suffices)
+            matrices = rng.integers(0, self.alphabet_size, size=(16, 2, 2))
+            dets = (matrices[:, 0, 0] * matrices[:, 1, 1] - matrices[:, 0, 1] * matrices[:, 1, 0]) % self.alphabet_size
+            valid = np.flatnonzero(_COPRIME_26[dets])
+            if valid.size:
+                return matrices[valid[0]].copy()
 
 
 # Example usage and testing
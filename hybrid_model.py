@@ -1,5 +1,7 @@
 import numpy as np
+import io
 import json
+import logging
 import os
 import tempfile
 import sys
@@ -23,12 +25,31 @@ except ImportError as e:
     except ImportError:
         raise ImportError("Could not import required modules")
 
+logger = logging.getLogger(__name__)
+
+
+def _enable_step_logging():
+    """Make INFO step messages visible, adding a plain stderr handler if logging isn't configured"""
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
 
 class HybridCryptoModel:
-    def __init__(self):
+    def __init__(self, verbose=False):
         self.hill_cipher = HillCipher()
         self.sdes = SDES()
         self.steganography = Steganography()
+        self.verbose = verbose  # Log each pipeline step (off for library/app use)
+        if verbose:
+            _enable_step_logging()
+    
+    def _log(self, message, *args):
+        """Log a progress message when verbose; formatting is skipped otherwise"""
+        if self.verbose:
+            logger.info(message, *args)
     
     def generate_keys(self):
         """Generate random keys for all algorithms"""
@@ -72,8 +93,8 @@ class HybridCryptoModel:
             plaintext (str): Text to encrypt
             hill_key (numpy.array): 2x2 matrix for Hill Cipher (optional, will generate if None)
             sdes_key (str): 10-bit binary string for SDES (optional, will generate if None)
-            image_path (str): Path to cover image for steganography
-            output_image_path (str): Path for output steganographic image
+            image_path (str or file-like): Path or open file for the cover image
+            output_image_path (str or file-like): Path or writable buffer for output steganographic image
         
         Returns:
             dict: Contains encrypted image path, keys used, and encryption details
@@ -85,35 +106,42 @@ class HybridCryptoModel:
                 hill_key = keys['hill_key'] if hill_key is None else hill_key
                 sdes_key = keys['sdes_key'] if sdes_key is None else sdes_key
             
-            print(f"🔐 Starting hybrid encryption...")
-            print(f"📝 Original text: {plaintext}")
+            self._log("🔐 Starting hybrid encryption...")
+            self._log("📝 Original text: %s", plaintext)
             
             # Step 1: Hill Cipher Encryption
-            print(f"\n🔑 Step 1: Hill Cipher Encryption")
+            self._log("\n🔑 Step 1: Hill Cipher Encryption")
             if isinstance(hill_key, list):
                 hill_key = np.array(hill_key)
             
-            hill_encrypted = self.hill_cipher.encrypt(plaintext, hill_key)
-            print(f"   Hill Cipher Result: {hill_encrypted}")
+            # Keep the Hill output as bytes so SDES can consume it directly
+            hill_bytes = self.hill_cipher.encrypt_bytes(plaintext, hill_key)
+            hill_encrypted = hill_bytes.decode('ascii')
+            self._log("   Hill Cipher Result: %s", hill_encrypted)
             
             # Step 2: SDES Encryption
-            print(f"\n🔒 Step 2: SDES Encryption")
-            sdes_encrypted_binary = self.sdes.encrypt_text(hill_encrypted, sdes_key)
-            print(f"   SDES Result (binary): {sdes_encrypted_binary[:50]}...")  # Show first 50 chars
+            self._log("\n🔒 Step 2: SDES Encryption")
+            sdes_encrypted_binary = self.sdes.bytes_to_binary(self.sdes.encrypt_bytes(hill_bytes, sdes_key))
+            self._log("   SDES Result (binary): %.50s...", sdes_encrypted_binary)  # Show first 50 chars
             
             # Step 3: Steganography
-            print(f"\n🖼️  Step 3: Steganography")
+            self._log("\n🖼️  Step 3: Steganography")
             
-            # Create a sample image if none provided
+            # Create a sample image in memory if none provided (nothing left on disk to clean up)
+            cover_image = image_path
             if image_path is None:
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-                    image_path = self.steganography.create_sample_image(
-                        width=800, height=600, output_path=tmp_file.name
-                    )
-                print(f"   Created cover image: {image_path}")
+                image_path = io.BytesIO()
+                # Read straight back in below, so skip most of the deflate work
+                self.steganography.create_sample_image(
+                    width=800, height=600, output_path=image_path, compress_level=1
+                )
+                self._log("   Created cover image in memory")
+            
+            # Decode the cover once; the capacity check and embedding share the pixels
+            cover_pixels = self.steganography.load_pixels(image_path, self.steganography.max_size)
+            total_bits = cover_pixels.size
             
             # Check if image can hold the message
-            max_chars, total_bits = self.steganography.get_image_capacity(image_path)
             if len(sdes_encrypted_binary) > total_bits:
                 raise ValueError(f"Message too large for image. Required: {len(sdes_encrypted_binary)} bits, Available: {total_bits} bits")
             
@@ -122,11 +150,13 @@ class HybridCryptoModel:
                 with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
                     output_image_path = tmp_file.name
             
-            stego_image_path, hidden_bits = self.steganography.hide_message(
-                image_path, sdes_encrypted_binary, output_image_path
+            stego_pixels, hidden_bits = self.steganography.hide_message_array(
+                cover_pixels, sdes_encrypted_binary
             )
-            print(f"   Steganography complete: {stego_image_path}")
-            print(f"   Hidden bits: {hidden_bits}")
+            self.steganography.save_pixels(stego_pixels, output_image_path)
+            stego_image_path = output_image_path
+            self._log("   Steganography complete: %s", stego_image_path)
+            self._log("   Hidden bits: %s", hidden_bits)
             
             # Prepare result
             result = {
@@ -140,18 +170,18 @@ class HybridCryptoModel:
                     'sdes_key': sdes_key
                 },
                 'image_info': {
-                    'cover_image': image_path,
+                    'cover_image': cover_image,
                     'stego_image': stego_image_path,
                     'hidden_bits': hidden_bits,
                     'image_capacity': total_bits
                 }
             }
             
-            print(f"\n✅ Hybrid encryption completed successfully!")
+            self._log("\n✅ Hybrid encryption completed successfully!")
             return result
             
         except Exception as e:
-            print(f"\n❌ Hybrid encryption failed: {str(e)}")
+            logger.warning("❌ Hybrid encryption failed: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -162,7 +192,7 @@ class HybridCryptoModel:
         Decrypt using hybrid model: Steganography -> SDES -> Hill Cipher
         
         Args:
-            encrypted_image_path (str): Path to steganographic image
+            encrypted_image_path (str or file-like): Path or open file for the steganographic image
             hill_key (numpy.array or list): 2x2 matrix for Hill Cipher
             sdes_key (str): 10-bit binary string for SDES
         
@@ -170,28 +200,28 @@ class HybridCryptoModel:
             dict: Contains decrypted text and decryption details
         """
         try:
-            print(f"🔓 Starting hybrid decryption...")
+            self._log("🔓 Starting hybrid decryption...")
             
             # Step 1: Extract from Steganography
-            print(f"\n🖼️  Step 1: Extracting from Steganography")
+            self._log("\n🖼️  Step 1: Extracting from Steganography")
             sdes_encrypted_binary = self.steganography.extract_message(encrypted_image_path)
-            print(f"   Extracted binary: {sdes_encrypted_binary[:50]}...")  # Show first 50 chars
+            self._log("   Extracted binary: %.50s...", sdes_encrypted_binary)  # Show first 50 chars
             
             if not sdes_encrypted_binary:
                 raise ValueError("No hidden message found in the image")
             
             # Step 2: SDES Decryption
-            print(f"\n🔒 Step 2: SDES Decryption")
+            self._log("\n🔒 Step 2: SDES Decryption")
             hill_encrypted = self.sdes.decrypt_text(sdes_encrypted_binary, sdes_key)
-            print(f"   SDES Decrypted: {hill_encrypted}")
+            self._log("   SDES Decrypted: %s", hill_encrypted)
             
             # Step 3: Hill Cipher Decryption
-            print(f"\n🔑 Step 3: Hill Cipher Decryption")
+            self._log("\n🔑 Step 3: Hill Cipher Decryption")
             if isinstance(hill_key, list):
                 hill_key = np.array(hill_key)
             
             original_text = self.hill_cipher.decrypt(hill_encrypted, hill_key)
-            print(f"   Final result: {original_text}")
+            self._log("   Final result: %s", original_text)
             
             # Prepare result
             result = {
@@ -204,11 +234,11 @@ class HybridCryptoModel:
                 }
             }
             
-            print(f"\n✅ Hybrid decryption completed successfully!")
+            self._log("\n✅ Hybrid decryption completed successfully!")
             return result
             
         except Exception as e:
-            print(f"\n❌ Hybrid decryption failed: {str(e)}")
+            logger.warning("❌ Hybrid decryption failed: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -216,8 +246,8 @@ class HybridCryptoModel:
     
     def test_hybrid_system(self, test_text="Hello World! This is a test of the hybrid cryptographic system."):
         """Test the complete hybrid system"""
-        print(f"🧪 Testing Hybrid Cryptographic System")
-        print(f"=" * 60)
+        self._log("🧪 Testing Hybrid Cryptographic System")
+        self._log("=" * 60)
         
         try:
             # Encrypt
@@ -228,7 +258,7 @@ class HybridCryptoModel:
             
             # Save keys for decryption
             keys_file = self.save_keys(encryption_result['keys'])
-            print(f"💾 Keys saved to: {keys_file}")
+            self._log("💾 Keys saved to: %s", keys_file)
             
             # Decrypt
             decryption_result = self.hybrid_decrypt(
@@ -244,19 +274,21 @@ class HybridCryptoModel:
             original = test_text
             decrypted = decryption_result['decrypted_text'].rstrip('X')  # Remove padding
             
-            print(f"\n📊 Test Results:")
-            print(f"   Original:  '{original}'")
-            print(f"   Decrypted: '{decrypted}'")
+            self._log("\n📊 Test Results:")
+            self._log("   Original:  '%s'", original)
+            self._log("   Decrypted: '%s'", decrypted)
             
             if original.upper() == decrypted.upper():
-                print(f"✅ TEST PASSED: Text matches!")
+                self._log("✅ TEST PASSED: Text matches!")
                 return True
             else:
-                print(f"❌ TEST FAILED: Text doesn't match!")
+                # Failures are reported whether or not verbose is set
+                logger.warning("❌ TEST FAILED: Text doesn't match! Original: '%s', Decrypted: '%s'",
+                               original, decrypted)
                 return False
                 
         except Exception as e:
-            print(f"❌ Test failed with error: {str(e)}")
+            logger.warning("❌ Test failed with error: %s", e)
             return False
     
     def get_system_info(self):
@@ -281,8 +313,8 @@ if __name__ == "__main__":
     print("Course: Cryptography and Network Security (Sem 7)")
     print("-" * 60)
     
-    # Create hybrid system
-    hybrid = HybridCryptoModel()
+    # Create hybrid system (with step-by-step output)
+    hybrid = HybridCryptoModel(verbose=True)
     
     # Display system information
     info = hybrid.get_system_info()
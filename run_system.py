@@ -42,15 +42,15 @@ def install_requirements():
         "matplotlib>=3.7.2"
     ]
     
-    for package in requirements:
-        try:
-            print(f"   Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package], 
-                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            print(f"   ✅ {package} installed")
-        except subprocess.CalledProcessError:
-            print(f"   ❌ Failed to install {package}")
-            return False
+    # One pip run resolves everything together (instead of a pip start-up per package)
+    try:
+        print(f"   Installing {', '.join(requirements)}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--disable-pip-version-check", *requirements],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        print("   ✅ Dependencies installed")
+    except subprocess.CalledProcessError:
+        print("   ❌ Failed to install dependencies")
+        return False
     
     return True
 
@@ -1,3 +1,7 @@
+import numpy as np
+import secrets
+
+
 class SDES:
     def __init__(self):
         # Permutation tables
@@ -22,11 +26,40 @@ class SDES:
             [3, 0, 1, 0],
             [2, 1, 0, 3]
         ]
+        
+        # Integer round tables (see _build_round_tables), built on first use
+        self._IP_T = None
+        
+        # Whole-cipher byte lookup tables, built once per (key, direction)
+        self._byte_tables = {}
     
     def permute(self, bits, table):
         """Apply permutation based on table"""
         return [bits[i-1] for i in table]
     
+    def _build_round_tables(self):
+        """Precompute the round function's steps as lookup tables over integer blocks"""
+        # The same permutations, so the integer round function needs no bit lists
+        ip_table = self._permutation_table(self.IP, 8)
+        self._IP_INV_T = self._permutation_table(self.IP_INV, 8)
+        self._EP_T = self._permutation_table(self.EP, 4)
+        
+        # Both S-boxes and P4 are a pure function of the 8-bit (expanded ^ subkey)
+        # value, so fold them into one table
+        self._SBOX_P4_T = [
+            self.bits_to_int(self.permute(self.sbox_substitution(self.int_to_bits(value, 8)), self.P4))
+            for value in range(256)
+        ]
+        
+        # Assigned last: byte_table treats _IP_T as "all tables built", and the
+        # apps share one instance across session threads
+        self._IP_T = ip_table
+    
+    def _permutation_table(self, table, in_length):
+        """Result of permute(table) for every in_length-bit integer, as integers"""
+        return [self.bits_to_int(self.permute(self.int_to_bits(value, in_length), table))
+                for value in range(1 << in_length)]
+    
     def left_shift(self, bits, shifts):
         """Perform left circular shift"""
         return bits[shifts:] + bits[:shifts]
@@ -37,24 +70,11 @@ class SDES:
     
     def string_to_bits(self, text):
         """Convert string to bit array (8 bits per character)"""
-        bits = []
-        for char in text:
-            ascii_val = ord(char)
-            char_bits = [(ascii_val >> i) & 1 for i in range(7, -1, -1)]
-            bits.extend(char_bits)
-        return bits
+        return np.unpackbits(np.frombuffer(self._text_bytes(text), dtype=np.uint8)).tolist()
     
     def bits_to_string(self, bits):
         """Convert bit array to string"""
-        text = ""
-        for i in range(0, len(bits), 8):
-            byte = bits[i:i+8]
-            if len(byte) == 8:
-                ascii_val = 0
-                for j, bit in enumerate(byte):
-                    ascii_val += bit * (2 ** (7-j))
-                text += chr(ascii_val)
-        return text
+        return self._pack_bits(bits).decode('latin-1')
     
     def int_to_bits(self, num, length):
         """Convert integer to bit array of specified length"""
@@ -159,63 +179,96 @@ class SDES:
         # Inverse initial permutation
         return self.permute(combined, self.IP_INV)
     
+    def _f_int(self, right, subkey):
+        """f-function on a 4-bit integer half with an 8-bit integer subkey"""
+        return self._SBOX_P4_T[self._EP_T[right] ^ subkey]
+    
+    def _encrypt_int(self, block, k1, k2):
+        """encrypt_block on an integer byte with integer subkeys"""
+        ip_result = self._IP_T[block]
+        left, right = ip_result >> 4, ip_result & 0xF
+        
+        # Round 1, then swap halves
+        left, right = right, left ^ self._f_int(right, k1)
+        
+        # Round 2 (no swap after final round)
+        left ^= self._f_int(right, k2)
+        
+        return self._IP_INV_T[(left << 4) | right]
+    
     def decrypt_block(self, ciphertext_bits, k1, k2):
         """Decrypt an 8-bit block (same as encrypt but with keys in reverse order)"""
         return self.encrypt_block(ciphertext_bits, k2, k1)
     
     def encrypt(self, plaintext, key):
         """Encrypt plaintext string"""
-        k1, k2 = self.generate_keys(key)
-        plaintext_bits = self.string_to_bits(plaintext)
-        
-        # Pad if necessary
-        while len(plaintext_bits) % 8 != 0:
-            plaintext_bits.append(0)
-        
-        ciphertext_bits = []
-        
-        # Encrypt each 8-bit block
-        for i in range(0, len(plaintext_bits), 8):
-            block = plaintext_bits[i:i+8]
-            encrypted_block = self.encrypt_block(block, k1, k2)
-            ciphertext_bits.extend(encrypted_block)
-        
-        return ciphertext_bits
+        # Every 8-bit block at once through the key's byte table
+        encrypted = self.encrypt_bytes(self._text_bytes(plaintext), key)
+        return np.unpackbits(np.frombuffer(encrypted, dtype=np.uint8)).tolist()
     
     def decrypt(self, ciphertext_bits, key):
         """Decrypt ciphertext bits"""
-        k1, k2 = self.generate_keys(key)
-        
-        plaintext_bits = []
-        
-        # Decrypt each 8-bit block
-        for i in range(0, len(ciphertext_bits), 8):
-            block = ciphertext_bits[i:i+8]
-            if len(block) == 8:
-                decrypted_block = self.decrypt_block(block, k1, k2)
-                plaintext_bits.extend(decrypted_block)
-        
-        return plaintext_bits
+        decrypted = self.decrypt_bytes(self._pack_bits(ciphertext_bits), key)
+        return np.unpackbits(np.frombuffer(decrypted, dtype=np.uint8)).tolist()
+    
+    def byte_table(self, key, decrypt=False):
+        """256-byte translation table mapping every input byte to its SDES output for this key"""
+        cache_key = (str(key), decrypt)
+        table = self._byte_tables.get(cache_key)
+        if table is None:
+            k1, k2 = (self.bits_to_int(subkey) for subkey in self.generate_keys(key))
+            if self._IP_T is None:
+                self._build_round_tables()
+            if decrypt:
+                k1, k2 = k2, k1
+            # An 8-bit block size means the full cipher is just a byte substitution,
+            # which bytes.translate applies in C
+            table = bytes(self._encrypt_int(value, k1, k2) for value in range(256))
+            self._byte_tables[cache_key] = table
+        return table
+    
+    def encrypt_bytes(self, data, key):
+        """Encrypt raw bytes and return the packed ciphertext bytes"""
+        return bytes(data).translate(self.byte_table(key))
+    
+    def decrypt_bytes(self, data, key):
+        """Decrypt packed ciphertext bytes"""
+        return bytes(data).translate(self.byte_table(key, decrypt=True))
+    
+    def _text_bytes(self, text):
+        """Low 8 bits of each code point, as string_to_bits takes them"""
+        return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint8).tobytes()
+    
+    def _pack_bits(self, bits):
+        """Pack a bit list/array into bytes, dropping any trailing partial block"""
+        bits = np.asarray(bits, dtype=np.uint8)
+        return np.packbits(bits[:len(bits) - len(bits) % 8]).tobytes()
     
     def encrypt_text(self, plaintext, key):
         """Encrypt text and return as binary string"""
-        encrypted_bits = self.encrypt(plaintext, key)
-        return ''.join(str(bit) for bit in encrypted_bits)
+        return self.bytes_to_binary(self.encrypt_bytes(self._text_bytes(plaintext), key))
+    
+    def bytes_to_binary(self, data):
+        """Convert packed bytes to a '0'/'1' string (8 bits per byte)"""
+        # Only materialize the '0'/'1' string at the edge
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        return (bits + ord('0')).tobytes().decode('ascii')
     
     def decrypt_text(self, ciphertext_binary, key):
         """Decrypt binary string and return as text"""
         if isinstance(ciphertext_binary, str):
-            ciphertext_bits = [int(c) for c in ciphertext_binary]
+            if ciphertext_binary.count('0') + ciphertext_binary.count('1') != len(ciphertext_binary):
+                raise ValueError("Ciphertext must be a binary string")
+            ciphertext_bits = np.frombuffer(ciphertext_binary.encode('ascii'), dtype=np.uint8) - ord('0')
         else:
             ciphertext_bits = ciphertext_binary
-            
-        decrypted_bits = self.decrypt(ciphertext_bits, key)
-        return self.bits_to_string(decrypted_bits)
+        
+        return self.decrypt_bytes(self._pack_bits(ciphertext_bits), key).decode('latin-1')
     
     def generate_random_key(self):
         """Generate a random 10-bit key"""
-        import random
-        return ''.join(str(random.randint(0, 1)) for _ in range(10))
+        # One draw from the OS CSPRNG (appropriate for key material)
+        return format(secrets.randbits(10), '010b')
 
 
 # Example usage and testing
@@ -6,6 +6,11 @@ import os
 class Steganography:
     def __init__(self):
         self.delimiter = "###END###"  # Delimiter to mark end of hidden message
+        self.max_size = (2000, 2000)  # Cover images are downscaled to fit (Streamlit Cloud memory)
+        
+        # Delimiter as the '0'/'1' bytes extraction searches for (kept with the
+        # delimiter it was built from, in case that is changed later)
+        self._delimiter_binary = (self.delimiter, self.string_to_binary(self.delimiter).encode('ascii'))
         
     def string_to_binary(self, text):
         """Convert string to binary representation"""
@@ -29,90 +34,107 @@ class Steganography:
         """Get the least significant bit of a pixel value"""
         return pixel_value & 1
     
+    def load_pixels(self, image_path, max_size=None):
+        """Decode an image (path or file-like object) to a read-only RGB uint8 pixel array"""
+        img = Image.open(image_path)
+        
+        # Limit image size to prevent memory issues
+        if max_size and (img.size[0] > max_size[0] or img.size[1] > max_size[1]):
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        
+        # Ensure RGB format (convert() would copy an image that already is)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        # asarray wraps PIL's pixel buffer instead of copying it again
+        return np.asarray(img, dtype=np.uint8)
+    
     def hide_message(self, image_path, message, output_path=None):
-        """Hide message in image using LSB steganography"""
+        """Hide message in image using LSB steganography (image_path may also be a file-like object, output_path a writable buffer)"""
         try:
             # Load image with size limit for Streamlit Cloud
-            img = Image.open(image_path)
-            
-            # Limit image size to prevent memory issues
-            max_size = (2000, 2000)
-            if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
-                img.thumbnail(max_size, Image.Resampling.LANCZOS)
-            
-            img = img.convert('RGB')  # Ensure RGB format
-            pixels = np.array(img, dtype=np.uint8)
+            pixels = self.load_pixels(image_path, self.max_size)
             
-            # Add delimiter to message
-            message_with_delimiter = message + self.delimiter
-            
-            # Convert message to binary
-            binary_message = self.string_to_binary(message_with_delimiter)
-            
-            # Check if image is large enough
-            max_capacity = pixels.size  # Total number of pixel values (R, G, B)
-            if len(binary_message) > max_capacity:
-                raise ValueError(f"Message too large for image. Max capacity: {max_capacity} bits, Message size: {len(binary_message)} bits")
-            
-            # Flatten the pixel array
-            flat_pixels = pixels.flatten()
-            
-            # Hide message bits in LSBs
-            for i, bit in enumerate(binary_message):
-                flat_pixels[i] = self.modify_lsb(flat_pixels[i], bit)
-            
-            # Reshape back to original shape
-            modified_pixels = flat_pixels.reshape(pixels.shape)
-            
-            # Create new image
-            stego_img = Image.fromarray(modified_pixels.astype(np.uint8))
+            modified_pixels, hidden_bits = self.hide_message_array(pixels, message)
             
             # Save image
             if output_path is None:
                 base_name = os.path.splitext(image_path)[0]
                 output_path = f"{base_name}_stego.png"
             
-            stego_img.save(output_path, 'PNG')  # Save as PNG to avoid compression
+            self.save_pixels(modified_pixels, output_path)
             
-            return output_path, len(binary_message)
+            return output_path, hidden_bits
             
         except Exception as e:
             raise Exception(f"Error hiding message: {str(e)}")
     
+    def save_pixels(self, pixels, output_path):
+        """Save a pixel array as PNG (output_path may be a path or a writable buffer)"""
+        stego_img = Image.fromarray(pixels.astype(np.uint8))
+        
+        # Lossless PNG; the noisy LSB plane barely compresses, so use the cheapest deflate level
+        stego_img.save(output_path, 'PNG', compress_level=1)
+    
+    def hide_message_array(self, pixels, message):
+        """Hide message in the LSBs of a uint8 pixel array and return (new array, bits hidden)"""
+        # Add delimiter to message
+        message_with_delimiter = message + self.delimiter
+        
+        # Convert message to binary (8 bits per character, so one unpackbits
+        # when every character fits in a byte)
+        try:
+            bits = np.unpackbits(np.frombuffer(message_with_delimiter.encode('latin-1'), dtype=np.uint8))
+        except UnicodeEncodeError:
+            binary_message = self.string_to_binary(message_with_delimiter)
+            bits = np.frombuffer(binary_message.encode('ascii'), dtype=np.uint8) - ord('0')
+        
+        # Check if image is large enough
+        max_capacity = pixels.size  # Total number of pixel values (R, G, B)
+        if bits.size > max_capacity:
+            raise ValueError(f"Message too large for image. Max capacity: {max_capacity} bits, Message size: {bits.size} bits")
+        
+        # Flatten the pixel array (a copy, so the caller's array is left untouched)
+        flat_pixels = pixels.flatten()
+        
+        # Hide message bits in LSBs, all at once and in place (no temporaries)
+        payload_pixels = flat_pixels[:bits.size]
+        payload_pixels &= 0xFE
+        payload_pixels |= bits
+        
+        # Reshape back to original shape
+        return flat_pixels.reshape(pixels.shape), bits.size
+    
     def extract_message(self, image_path):
-        """Extract hidden message from image"""
+        """Extract hidden message from image (path or file-like object)"""
         try:
             # Load image
-            img = Image.open(image_path)
-            img = img.convert('RGB')
-            pixels = np.array(img)
-            
-            # Flatten the pixel array
-            flat_pixels = pixels.flatten()
+            pixels = self.load_pixels(image_path)
             
-            # Extract LSBs to form binary message
-            binary_message = ''
-            delimiter_binary = self.string_to_binary(self.delimiter)
-            
-            for pixel_value in flat_pixels:
-                binary_message += str(self.get_lsb(pixel_value))
-                
-                # Check if we've found the delimiter
-                if binary_message.endswith(delimiter_binary):
-                    # Remove delimiter from message
-                    binary_message = binary_message[:-len(delimiter_binary)]
-                    break
-            
-            # Convert binary to string
-            if binary_message:
-                message = self.binary_to_string(binary_message)
-                return message
-            else:
-                return ""
+            return self.extract_message_array(pixels)
                 
         except Exception as e:
             raise Exception(f"Error extracting message: {str(e)}")
     
+    def extract_message_array(self, pixels):
+        """Extract hidden message from the LSBs of a pixel array"""
+        # Extract all LSBs at once, as '0'/'1' characters (ravel is a view, so the
+        # only full-size array is the LSB plane itself)
+        lsb = np.asarray(pixels, dtype=np.uint8).ravel() & 1
+        lsb += ord('0')
+        lsb_chars = lsb.tobytes()
+        if self._delimiter_binary[0] != self.delimiter:
+            self._delimiter_binary = (self.delimiter, self.string_to_binary(self.delimiter).encode('ascii'))
+        delimiter_binary = self._delimiter_binary[1]
+        
+        # The message ends where the delimiter first appears (at any bit offset)
+        end = lsb_chars.find(delimiter_binary)
+        bits = np.frombuffer(lsb_chars if end == -1 else lsb_chars[:end], dtype=np.uint8) - ord('0')
+        
+        # Convert binary to string (a trailing partial byte is dropped)
+        bits = bits[:bits.size - bits.size % 8]
+        return np.packbits(bits).tobytes().decode('latin-1')
+    
     def get_image_capacity(self, image_path):
         """Calculate maximum message capacity of an image"""
         try:
@@ -132,22 +154,20 @@ class Steganography:
         except Exception as e:
             raise Exception(f"Error calculating capacity: {str(e)}")
     
-    def create_sample_image(self, width=800, height=600, output_path="sample_image.png"):
-        """Create a sample image for testing"""
+    def create_sample_image(self, width=800, height=600, output_path="sample_image.png", compress_level=6):
+        """Create a sample image for testing (use compress_level=1 for throwaway intermediates)"""
         try:
-            # Create a colorful gradient image
-            img_array = np.zeros((height, width, 3), dtype=np.uint8)
+            # Create a colorful gradient image (whole planes at once via broadcasting)
+            img_array = np.empty((height, width, 3), dtype=np.uint8)
+            x = np.arange(width, dtype=np.float64)
+            y = np.arange(height, dtype=np.float64)[:, None]
             
-            for y in range(height):
-                for x in range(width):
-                    img_array[y, x] = [
-                        int(255 * x / width),          # Red gradient
-                        int(255 * y / height),         # Green gradient
-                        int(255 * (x + y) / (width + height))  # Blue gradient
-                    ]
+            img_array[:, :, 0] = (255 * x / width).astype(np.uint8)          # Red gradient
+            img_array[:, :, 1] = (255 * y / height).astype(np.uint8)         # Green gradient
+            img_array[:, :, 2] = (255 * (x + y) / (width + height)).astype(np.uint8)  # Blue gradient
             
             img = Image.fromarray(img_array)
-            img.save(output_path, 'PNG')
+            img.save(output_path, 'PNG', compress_level=compress_level)
             
             return output_path
             
@@ -157,14 +177,12 @@ class Steganography:
     def compare_images(self, original_path, stego_path):
         """Compare original and steganographic images"""
         try:
-            img1 = Image.open(original_path).convert('RGB')
-            img2 = Image.open(stego_path).convert('RGB')
-            
-            pixels1 = np.array(img1)
-            pixels2 = np.array(img2)
+            pixels1 = self.load_pixels(original_path)
+            pixels2 = self.load_pixels(stego_path)
             
-            # Calculate differences
-            diff = np.abs(pixels1.astype(int) - pixels2.astype(int))
+            # Calculate differences (int16 holds -255..255; no int64 copies of both images)
+            diff = np.subtract(pixels1, pixels2, dtype=np.int16)
+            np.abs(diff, out=diff)
             
             # Calculate statistics
             max_diff = np.max(diff)
@@ -82,6 +82,32 @@ class TestRunner:
             
             self.log_test("Hill Long Text", original_upper == decrypted_clean, f"Length: {len(long_text)} chars")
             
+            # Test 5: Digraph table matches K * P mod 26 for every block, with an int8 key
+            # whose products overflow int8 (det = 53 = 1 mod 26)
+            int8_key = np.array([[25, 24], [3, 5]], dtype=np.int8)
+            all_digraphs = "".join(a + b for a in hill.alphabet for b in hill.alphabet)
+            expected = "".join(
+                hill.num_to_char(int(n))
+                for p0 in range(26) for p1 in range(26)
+                for n in (int8_key.astype(int) @ [p0, p1]) % 26
+            )
+            int8_encrypted = hill.encrypt(all_digraphs, int8_key)
+            int8_round_trip = hill.decrypt(int8_encrypted, int8_key) == all_digraphs
+            
+            self.log_test("Hill Digraph Table (int8 key)", int8_encrypted == expected and int8_round_trip,
+                          "All 676 digraphs")
+            
+            # Test 6: Integral float keys decrypt the same as their int equivalents
+            float_key = np.array([[3., 2.], [5., 7.]])
+            float_decrypted = hill.decrypt(encrypted, float_key)
+            
+            self.log_test("Hill Float Key", float_decrypted == hill.decrypt(encrypted, key), f"'{encrypted}' -> '{float_decrypted}'")
+            
+            # Test 7: Only A-Z survive text preparation (non-ASCII letters are dropped)
+            prepared = hill.prepare_text("héllo ß!")
+            
+            self.log_test("Hill Prepare Text", prepared == "HLLO", f"'héllo ß!' -> '{prepared}'")
+            
         except Exception as e:
             self.log_test("Hill Cipher Error", False, str(e))
     
@@ -126,6 +152,29 @@ class TestRunner:
             
             self.log_test("SDES Random Key", is_10_bits, f"Generated: {random_key}")
             
+            # Test 5: Byte tables match the bit-level block cipher (a spread of fixed keys,
+            # both directions) and the textbook vector 10010111 -> 00111000 under 1010000010
+            tables_match = True
+            for table_key in ["0000000000", "1111111111", "1010000010", "0111111101", "1000101110", "0101010101"]:
+                k1, k2 = sdes.generate_keys(table_key)
+                for decrypt, subkeys in ((False, (k1, k2)), (True, (k2, k1))):
+                    expected = bytes(
+                        sdes.bits_to_int(sdes.encrypt_block(sdes.int_to_bits(value, 8), *subkeys))
+                        for value in range(256)
+                    )
+                    if sdes.byte_table(table_key, decrypt) != expected:
+                        tables_match = False
+            known_answer = sdes.byte_table("1010000010")[0b10010111] == 0b00111000
+            
+            self.log_test("SDES Byte Tables", tables_match and known_answer, "6 keys, both directions, known-answer vector")
+            
+            # Test 6: Bytes mode round trip over every byte value
+            all_bytes = bytes(range(256))
+            packed = sdes.encrypt_bytes(all_bytes, key)
+            bytes_round_trip = sdes.decrypt_bytes(packed, key) == all_bytes and len(packed) == 256
+            
+            self.log_test("SDES Bytes Mode", bytes_round_trip, f"{len(packed)} bytes")
+            
         except Exception as e:
             self.log_test("SDES Error", False, str(e))
     
@@ -165,6 +214,21 @@ class TestRunner:
                     
                     self.log_test("Stego Visual Impact", low_change, f"{comparison['change_percentage']:.2f}% changed")
                 
+                # Test 5: Array round trips against the bit-string reference
+                # (non-Latin-1 characters, and a delimiter inside the payload)
+                pixels = stego.load_pixels(sample_image)
+                delimiter_binary = stego.string_to_binary(stego.delimiter)
+                arrays_match = True
+                for message in ["Ωmega → ünïcode ✓", "before###END###after"]:
+                    reference_bits = stego.string_to_binary(message + stego.delimiter)
+                    expected = stego.binary_to_string(reference_bits[:reference_bits.find(delimiter_binary)])
+                    
+                    stego_pixels, bits = stego.hide_message_array(pixels, message)
+                    if stego.extract_message_array(stego_pixels) != expected or bits != len(reference_bits):
+                        arrays_match = False
+                
+                self.log_test("Stego Array Round Trip", arrays_match, "Non-Latin-1 and embedded delimiter")
+                
                 # Clean up test files
                 for file in [sample_image, stego_image]:
                     try: